@@ -185,6 +185,28 @@ if [ -d "$TEMP_DIR/config" ]; then
     kubectl apply -f "$TEMP_DIR/config/"
 fi
 
+# Run jobs (database migrations) before the backend rolls out
+if [ -d "$TEMP_DIR/jobs" ]; then
+    echo "⚙️ Running jobs..."
+    for file in "$TEMP_DIR/jobs"/*.yaml; do
+        if [ -f "$file" ]; then
+            # Job pod templates are immutable, and a completed Job with the
+            # same name (e.g. IMAGE_TAG=latest) would satisfy the wait, so
+            # always start from a fresh Job
+            kubectl delete -f "$file" --ignore-not-found --wait=true
+            if ! kubectl apply -f "$file"; then
+                echo "❌ Failed to apply job: $(basename "$file")"
+                exit 1
+            fi
+            if ! kubectl wait --for=condition=complete --timeout=300s -f "$file"; then
+                echo "❌ Job did not complete: $(basename "$file")"
+                exit 1
+            fi
+        fi
+    done
+    echo "✅ Jobs completed"
+fi
+
 # Deploy backend components
 if [ -d "$TEMP_DIR/backend" ]; then
     echo "🔧 Deploying backend..."
@@ -278,17 +300,6 @@ if [ -d "$TEMP_DIR/policies" ]; then
     echo "✅ Security policies deployed"
 fi
 
-# Deploy jobs if they exist
-if [ -d "$TEMP_DIR/jobs" ]; then
-    echo "⚙️ Deploying jobs..."
-    for file in "$TEMP_DIR/jobs"/*.yaml; do
-        if [ -f "$file" ]; then
-            kubectl apply -f "$file" || echo "⚠️ Failed to apply job: $(basename "$file")"
-        fi
-    done
-    echo "✅ Jobs deployed"
-fi
-
 # Wait for deployments to be ready
 echo "⏳ Waiting for deployments to be ready..."
 sleep 5
@@ -56,10 +56,10 @@ function App() {
   const fetchTasks = async () => {
     try {
       setLoading(true);
-      const response = await fetch(`${API_BASE}/tasks`);
+      const response = await fetch(`${API_BASE}/tasks?limit=100`);
       if (!response.ok) throw new Error('Failed to fetch tasks');
       const data = await response.json();
-      setTasks(data);
+      setTasks(data.items);
     } catch (err) {
       setError(err.message);
     } finally {